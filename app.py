@@ -1,5 +1,8 @@
+import startup_profile
+
 import flet as ft
-import requests
+
+startup_profile.log("import flet")
 
 AREA_URL = "http://www.jma.go.jp/bosai/common/const/area.json"
 FORECAST_URL_TEMPLATE = "https://www.jma.go.jp/bosai/forecast/data/forecast/{area_code}.json"
@@ -29,15 +32,12 @@ def main(page: ft.Page):
         bgcolor=ft.Colors.INDIGO,
     )
 
-    try:
-        area_data = requests.get(AREA_URL).json()
-        centers = area_data['centers']
-        offices = area_data['offices']
-    except Exception as e:
-        page.add(ft.Text(f"データ取得エラー: {e}", color="red"))
-        return
-
-    weather_column = ft.Column(scroll=ft.ScrollMode.HIDDEN, expand=True)
+    # 先に画面の枠だけ描画して、通信は後から行う
+    weather_column = ft.Column(
+        [ft.Row([ft.ProgressRing()], alignment=ft.MainAxisAlignment.CENTER)],
+        scroll=ft.ScrollMode.HIDDEN,
+        expand=True,
+    )
     
     main_content = ft.Container(
         content=weather_column,
@@ -45,6 +45,13 @@ def main(page: ft.Page):
         expand=True
     )
 
+    layout = ft.Row([main_content], expand=True, spacing=0)
+    page.add(layout)
+    startup_profile.log("first paint")
+
+    centers = {}
+    offices = {}
+
     def update_weather_view(center_code):
         weather_column.controls.clear()
         
@@ -67,6 +74,7 @@ def main(page: ft.Page):
                 container.update()
 
                 try:
+                    import requests
                     url = FORECAST_URL_TEMPLATE.format(area_code=area_code)
                     res = requests.get(url).json()
                     
@@ -133,42 +141,61 @@ def main(page: ft.Page):
         if 0 <= selected_index < len(keys):
             update_weather_view(keys[selected_index])
 
-    rail_destinations = []
-    for c_code, c_info in centers.items():
-        rail_destinations.append(
-            ft.NavigationRailDestination(
-                icon=ft.Icons.MAP_OUTLINED,
-                selected_icon=ft.Icons.MAP_SHARP,
-                label=c_info['name'],
-                padding=10,
+    def build_rail():
+        rail_destinations = []
+        for c_code, c_info in centers.items():
+            rail_destinations.append(
+                ft.NavigationRailDestination(
+                    icon=ft.Icons.MAP_OUTLINED,
+                    selected_icon=ft.Icons.MAP_SHARP,
+                    label=c_info['name'],
+                    padding=10,
+                )
             )
-        )
 
-    rail = ft.NavigationRail(
-        selected_index=0,
-        label_type=ft.NavigationRailLabelType.ALL,
-        min_width=100,
-        min_extended_width=200,
-        group_alignment=-0.9,
-        destinations=rail_destinations,
-        on_change=rail_changed,
-        bgcolor=ft.Colors.BLUE_GREY_50,
-    )
-
-    if centers:
-        first_center_code = list(centers.keys())[0]
-        update_weather_view(first_center_code)
-
-    page.add(
-        ft.Row(
-            [
-                rail,
-                ft.VerticalDivider(width=1, color=ft.Colors.GREY_300),
-                main_content,
-            ],
-            expand=True,
-            spacing=0,
+        rail = ft.NavigationRail(
+            selected_index=0,
+            label_type=ft.NavigationRailLabelType.ALL,
+            min_width=100,
+            min_extended_width=200,
+            group_alignment=-0.9,
+            destinations=rail_destinations,
+            on_change=rail_changed,
+            bgcolor=ft.Colors.BLUE_GREY_50,
         )
-    )
 
-ft.app(target=main)
\ No newline at end of file
+        layout.controls = [
+            rail,
+            ft.VerticalDivider(width=1, color=ft.Colors.GREY_300),
+            main_content,
+        ]
+
+        if centers:
+            first_center_code = list(centers.keys())[0]
+            update_weather_view(first_center_code)
+        else:
+            page.update()
+
+    # 通信は別スレッドで行い、mainはすぐに返す
+    def load_app():
+        nonlocal centers, offices
+
+        try:
+            import requests
+            startup_profile.log("import requests")
+            area_data = requests.get(AREA_URL).json()
+            centers = area_data['centers']
+            offices = area_data['offices']
+        except Exception as e:
+            weather_column.controls.clear()
+            weather_column.controls.append(ft.Text(f"データ取得エラー: {e}", color="red"))
+            page.update()
+            return
+        startup_profile.log("area data")
+
+        build_rail()
+        startup_profile.log("fully loaded")
+
+    page.run_thread(load_app)
+
+ft.app(target=main)
@@ -1,6 +1,10 @@
-import flet as ft
+import startup_profile
 import math
 
+import flet as ft
+
+startup_profile.log("import flet")
+
 
 class CalcButton(ft.ElevatedButton):
     def __init__(self, text, button_clicked, expand=1):
@@ -179,6 +183,7 @@ class CalculatorApp(ft.Container):
 def main(page: ft.Page):
     page.title = "Scientific Calculator"
     page.add(CalculatorApp())
+    startup_profile.log("first paint")
 
 
 ft.app(main)
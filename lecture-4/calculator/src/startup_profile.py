@@ -0,0 +1,23 @@
+import os
+import sys
+import time
+
+START_TIME = time.perf_counter()
+LOG_PATH = os.environ.get("PROFILE_STARTUP_LOG")
+ENABLED = bool(LOG_PATH) or "--profile-startup" in sys.argv or os.environ.get("PROFILE_STARTUP") == "1"
+
+
+def log(label):
+    # すべてスクリプト開始時点からの経過時間で記録する
+    if not ENABLED:
+        return
+    line = f"STARTUP: {label}: {(time.perf_counter() - START_TIME) * 1000:.1f} ms since script start"
+    # パッケージ版では標準エラーが見えないので、指定があればファイルに追記する
+    if LOG_PATH:
+        try:
+            with open(LOG_PATH, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+            return
+        except OSError:
+            pass
+    print(line, file=sys.stderr)
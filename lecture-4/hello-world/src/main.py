@@ -1,5 +1,9 @@
+import startup_profile
+
 import flet as ft
 
+startup_profile.log("import flet")
+
 
 def main(page: ft.Page):
     counter = ft.Text("0", size=50, data=0)
@@ -21,6 +25,7 @@ def main(page: ft.Page):
             expand=True,
         )
     )
+    startup_profile.log("first paint")
 
 
 ft.app(main)
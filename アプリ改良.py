@@ -1,13 +1,16 @@
-import flet as ft
-import requests
-import sqlite3
+import startup_profile
 import datetime
 
+import flet as ft
+
+startup_profile.log("import flet")
+
 DB_NAME = "weather_app.db"
 AREA_URL = "http://www.jma.go.jp/bosai/common/const/area.json"
 FORECAST_URL_TEMPLATE = "https://www.jma.go.jp/bosai/forecast/data/forecast/{area_code}.json"
 
 def init_db():
+    import sqlite3
     conn = sqlite3.connect(DB_NAME)
     cursor = conn.cursor()
     cursor.execute("""
@@ -24,6 +27,7 @@ def init_db():
     conn.close()
 
 def save_forecasts_to_db(area_code, forecast_list):
+    import sqlite3
     conn = sqlite3.connect(DB_NAME)
     cursor = conn.cursor()
     
@@ -43,6 +47,7 @@ def save_forecasts_to_db(area_code, forecast_list):
     print(f"DEBUG: Saved {len(forecast_list)} records to DB for area {area_code}")
 
 def get_forecasts_from_db(area_code):
+    import sqlite3
     conn = sqlite3.connect(DB_NAME)
     cursor = conn.cursor()
 
@@ -70,8 +75,6 @@ def get_weather_icon(text):
         return ft.Icons.WB_CLOUDY_OUTLINED, ft.Colors.BLUE_GREY
 
 def main(page: ft.Page):
-    init_db()
-
     page.title = "天気予報アプリ"
     page.theme = ft.Theme(color_scheme_seed=ft.Colors.INDIGO)
     page.theme_mode = ft.ThemeMode.LIGHT
@@ -83,17 +86,21 @@ def main(page: ft.Page):
         bgcolor=ft.Colors.INDIGO_800,
     )
 
-    try:
-        area_data = requests.get(AREA_URL).json()
-        centers = area_data['centers']
-        offices = area_data['offices']
-    except Exception as e:
-        page.add(ft.Text(f"エリアデータ取得エラー: {e}", color="red"))
-        return
-
-    weather_column = ft.Column(scroll=ft.ScrollMode.HIDDEN, expand=True)
+    # 先に画面の枠だけ描画して、DB初期化と通信は後から行う
+    weather_column = ft.Column(
+        [ft.Row([ft.ProgressRing()], alignment=ft.MainAxisAlignment.CENTER)],
+        scroll=ft.ScrollMode.HIDDEN,
+        expand=True,
+    )
     main_content = ft.Container(content=weather_column, padding=20, expand=True)
 
+    layout = ft.Row([main_content], expand=True, spacing=0)
+    page.add(layout)
+    startup_profile.log("first paint")
+
+    centers = {}
+    offices = {}
+
     def render_forecasts(container, data_source_text, forecasts):
         container.controls.clear()
         
@@ -143,6 +150,7 @@ def main(page: ft.Page):
                 container.update()
 
                 try:
+                    import requests
                     url = FORECAST_URL_TEMPLATE.format(area_code=area_code)
                     res = requests.get(url).json()
                     
@@ -217,37 +225,66 @@ def main(page: ft.Page):
         if 0 <= selected_index < len(keys):
             update_weather_view(keys[selected_index])
 
-    rail_destinations = []
-    for c_code, c_info in centers.items():
-        rail_destinations.append(
-            ft.NavigationRailDestination(
-                icon=ft.Icons.MAP_OUTLINED,
-                selected_icon=ft.Icons.MAP_SHARP,
-                label=c_info['name'],
-                padding=10,
+    def build_rail():
+        rail_destinations = []
+        for c_code, c_info in centers.items():
+            rail_destinations.append(
+                ft.NavigationRailDestination(
+                    icon=ft.Icons.MAP_OUTLINED,
+                    selected_icon=ft.Icons.MAP_SHARP,
+                    label=c_info['name'],
+                    padding=10,
+                )
             )
+
+        rail = ft.NavigationRail(
+            selected_index=0,
+            label_type=ft.NavigationRailLabelType.ALL,
+            min_width=100,
+            min_extended_width=200,
+            group_alignment=-0.9,
+            destinations=rail_destinations,
+            on_change=rail_changed,
+            bgcolor=ft.Colors.BLUE_GREY_50,
         )
 
-    rail = ft.NavigationRail(
-        selected_index=0,
-        label_type=ft.NavigationRailLabelType.ALL,
-        min_width=100,
-        min_extended_width=200,
-        group_alignment=-0.9,
-        destinations=rail_destinations,
-        on_change=rail_changed,
-        bgcolor=ft.Colors.BLUE_GREY_50,
-    )
+        layout.controls = [rail, ft.VerticalDivider(width=1, color=ft.Colors.GREY_300), main_content]
 
-    if centers:
-        update_weather_view(list(centers.keys())[0])
+        if centers:
+            update_weather_view(list(centers.keys())[0])
+        else:
+            page.update()
 
-    page.add(
-        ft.Row(
-            [rail, ft.VerticalDivider(width=1, color=ft.Colors.GREY_300), main_content],
-            expand=True,
-            spacing=0,
-        )
-    )
+    def show_error(message):
+        weather_column.controls.clear()
+        weather_column.controls.append(ft.Text(message, color="red"))
+        page.update()
+
+    # DB初期化と通信は別スレッドで行い、mainはすぐに返す
+    def load_app():
+        nonlocal centers, offices
+
+        try:
+            init_db()
+        except Exception as e:
+            show_error(f"DB初期化エラー: {e}")
+            return
+        startup_profile.log("init_db")
+
+        try:
+            import requests
+            startup_profile.log("import requests")
+            area_data = requests.get(AREA_URL).json()
+            centers = area_data['centers']
+            offices = area_data['offices']
+        except Exception as e:
+            show_error(f"エリアデータ取得エラー: {e}")
+            return
+        startup_profile.log("area data")
+
+        build_rail()
+        startup_profile.log("fully loaded")
+
+    page.run_thread(load_app)
 
-ft.app(target=main)
\ No newline at end of file
+ft.app(target=main)